@@ -1,18 +1,75 @@
 import os
 import time
-import ccxt
-import pandas as pd
-from datetime import datetime
+import asyncio
+import heapq
+import ccxt.async_support as ccxt_async
+import numpy as np
+from numba import njit
+from collections import defaultdict, deque
+from datetime import datetime, timezone
 import requests
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Tuple
 import logging
 from threading import Thread
 from flask import Flask
+from waitress import serve
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Exchange selection (any ccxt exchange id); Coinbase quotes in USD, most others in USDT
+EXCHANGE = os.getenv('EXCHANGE', 'coinbase')
+if EXCHANGE not in ccxt_async.exchanges:
+    # Fail at startup rather than in the bot thread while /health keeps reporting healthy
+    raise ValueError(f"Unknown EXCHANGE '{EXCHANGE}': expected a ccxt exchange id")
+
+# An unconfigured instance opens no connection but carries the exchange's
+# display name and supported timeframes
+_exchange_info = getattr(ccxt_async, EXCHANGE)()
+EXCHANGE_NAME = _exchange_info.name
+QUOTE = 'USD' if EXCHANGE == 'coinbase' else 'USDT'
+
+# Candle timeframe, validated here for the same reason
+TIMEFRAME = os.getenv('TIMEFRAME', '1h')
+if TIMEFRAME not in _exchange_info.timeframes:
+    raise ValueError(f"TIMEFRAME '{TIMEFRAME}' is not supported by {EXCHANGE}")
+TIMEFRAME_MS = ccxt_async.Exchange.parse_timeframe(TIMEFRAME) * 1000
+if TIMEFRAME_MS >= 7 * 24 * 3600 * 1000:
+    # Candle boundaries are taken as multiples of the timeframe since the epoch;
+    # weekly candles open on Mondays (the epoch is a Thursday) and months vary in length
+    raise ValueError(f"TIMEFRAME '{TIMEFRAME}' is not supported: use a timeframe shorter than 1w")
+FALLBACK_PAIRS = [f"{base}/{QUOTE}" for base in ('BTC', 'ETH', 'SOL', 'XRP', 'AVAX')]
+
+# Telegram signal message, bound once so formatting is plain interpolation
+_SIGNAL_TEMPLATE = (
+    "{emoji} <b>{type} CROSSOVER DETECTED</b> {emoji}\n"
+    "\n"
+    "📊 <b>Symbol:</b> {symbol}\n"
+    "💰 <b>Price:</b> ${price:.2f}\n"
+    "📈 <b>EMA(10):</b> {ema_10:.2f}\n"
+    "📉 <b>EMA(20):</b> {ema_20:.2f}\n"
+    "⏰ <b>Time:</b> {timestamp_str}\n"
+    "⏱️ <b>Timeframe:</b> {timeframe}\n"
+    "🏦 <b>Exchange:</b> {exchange}"
+).format
+
+@njit(cache=True, fastmath=True)
+def dual_ema_numba(x, alpha_fast, alpha_slow):
+    """Two EMA recurrences (matching pandas ewm(adjust=False)) advanced in a single pass over x"""
+    out_fast = np.empty_like(x)
+    out_slow = np.empty_like(x)
+    s_fast = s_slow = x[0]
+    for i in range(len(x)):
+        xi = x[i]
+        s_fast = alpha_fast * xi + (1 - alpha_fast) * s_fast
+        s_slow = alpha_slow * xi + (1 - alpha_slow) * s_slow
+        out_fast[i] = s_fast
+        out_slow[i] = s_slow
+    return out_fast, out_slow
+
 # Flask app for keeping Render awake
 app = Flask(__name__)
 
@@ -29,8 +86,8 @@ def status():
     return {
         "bot": "Crypto Signal Bot",
         "status": "running",
-        "exchange": "Coinbase",
-        "timeframe": os.getenv('TIMEFRAME', '1h'),
+        "exchange": EXCHANGE_NAME,
+        "timeframe": TIMEFRAME,
         "monitoring": "Top 5 coins by volume",
         "signal_type": "EMA(10) x EMA(20) crossovers"
     }
@@ -40,157 +97,269 @@ class CryptoSignalBot:
         # Environment variables
         self.telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.timeframe = os.getenv('TIMEFRAME', '1h')
+        self.timeframe = TIMEFRAME
+        self.telegram_url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+        
+        # Persistent HTTP session so Telegram sends reuse one TLS connection.
+        # sendMessage is not idempotent: read timeouts and 5xx are not retried since
+        # Telegram may already have delivered, so only connect errors and 429s are.
+        # Retry-After is honoured, so a send can block for a while; the bot loop
+        # runs it in a worker thread to keep the event loop free.
+        self.http = requests.Session()
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429],
+            allowed_methods=frozenset(['POST'])
+        )
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
         
-        # Initialize Coinbase (no auth needed for public data)
-        self.exchange = ccxt.coinbase({
+        # Initialize the exchange (no auth needed for public data)
+        self.exchange = getattr(ccxt_async, EXCHANGE)({
             'enableRateLimit': True,
             'rateLimit': 1000
         })
+        self.timeframe_ms = TIMEFRAME_MS
         
         # Track last signals
         self.last_signals = {}
         
-        logger.info("Bot initialized with Coinbase exchange")
+        # EMA state per symbol as of its last closed candle:
+        # {symbol: {'ema10': float, 'ema20': float, 'last_ts': ms timestamp}}
+        self.ema_state: Dict[str, Dict] = {}
+        
+        # Rolling (timestamp ms, close) per symbol for 1h+ timeframes, fed from
+        # fetch_tickers; the last entry is the candle still forming
+        self.close_buffers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=64))
+        
+        # Cached top coins as (fetched_at, symbols); volume ranking changes slowly
+        self._top_coins_cache = (0.0, [])
+        
+        logger.info("Bot initialized with %s exchange", EXCHANGE_NAME)
     
     def send_telegram_message(self, message: str):
         """Send message via Telegram Bot"""
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
             payload = {
                 'chat_id': self.telegram_chat_id,
                 'text': message,
                 'parse_mode': 'HTML'
             }
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.http.post(self.telegram_url, json=payload, timeout=10)
             if response.status_code == 200:
                 logger.info("Telegram message sent successfully")
             else:
-                logger.error(f"Telegram send failed: {response.text}")
+                logger.error("Telegram send failed: %s", response.text)
         except Exception as e:
-            logger.error(f"Error sending Telegram message: {e}")
+            logger.error("Error sending Telegram message: %s", e)
     
-    def get_top_coins_by_volume(self, limit: int = 5) -> List[str]:
-        """Get top coins by 24h trading volume from Coinbase"""
+    async def get_top_coins_by_volume(self, limit: int = 5, tickers: Optional[Dict] = None) -> List[str]:
+        """Get top coins by 24h trading volume from the exchange"""
+        # Reuse the cached ranking for up to an hour
+        cached_at, cached_coins = self._top_coins_cache
+        if time.time() - cached_at < 3600 and len(cached_coins) >= limit:
+            return cached_coins[:limit]
+        
         try:
-            logger.info("Fetching Coinbase tickers...")
-            tickers = self.exchange.fetch_tickers()
+            if tickers is None:
+                logger.info("Fetching %s tickers...", EXCHANGE_NAME)
+                tickers = await self.exchange.fetch_tickers()
             
-            # Filter USD pairs (Coinbase uses USD, not USDT)
-            usd_pairs = {}
+            # Filter pairs in the exchange's quote currency as (volume, symbol)
+            quote = f'/{QUOTE}'
+            quote_pairs = []
             for symbol, ticker in tickers.items():
-                if '/USD' in symbol and ticker.get('quoteVolume'):
+                if quote in symbol:
                     try:
-                        volume = float(ticker['quoteVolume'])
-                        if volume > 0:
-                            usd_pairs[symbol] = ticker
+                        volume = float(ticker.get('quoteVolume') or 0)
                     except (ValueError, TypeError):
                         continue
+                    if volume > 0:
+                        quote_pairs.append((volume, symbol))
             
-            # Sort by volume
-            sorted_pairs = sorted(
-                usd_pairs.items(),
-                key=lambda x: float(x[1].get('quoteVolume', 0)),
-                reverse=True
-            )
-            
-            top_coins = [pair[0] for pair in sorted_pairs[:limit]]
-            logger.info(f"Top {limit} coins by volume (Coinbase): {top_coins}")
+            # Select the highest volumes without sorting every pair
+            top_coins = [symbol for _, symbol in heapq.nlargest(limit, quote_pairs)]
+            self._top_coins_cache = (time.time(), top_coins)
+            logger.info("Top %d coins by volume (%s): %s", limit, EXCHANGE_NAME, top_coins)
             return top_coins
             
         except Exception as e:
-            logger.error(f"Error fetching top coins: {e}")
+            logger.error("Error fetching top coins: %s", e)
             # Fallback to major pairs
-            return ['BTC/USD', 'ETH/USD', 'SOL/USD', 'XRP/USD', 'AVAX/USD']
-    
-    def calculate_ema(self, data: pd.Series, period: int) -> pd.Series:
-        """Calculate Exponential Moving Average"""
-        return data.ewm(span=period, adjust=False).mean()
+            return FALLBACK_PAIRS[:limit]
     
-    def fetch_ohlcv_data(self, symbol: str, timeframe: str, limit: int = 100) -> pd.DataFrame:
-        """Fetch OHLCV data from Coinbase"""
+    async def fetch_ohlcv_data(self, symbol: str, timeframe: str, limit: int = 25) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Fetch closes and their candle timestamps (ms) from the exchange"""
         try:
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            return df
+            # Explicit since so exchanges can't hand back an older paginated window
+            tf_ms = self.exchange.parse_timeframe(timeframe) * 1000
+            since = (self.exchange.milliseconds() // tf_ms - (limit - 1)) * tf_ms
+            ohlcv = await self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+            arr = np.asarray(ohlcv, dtype=np.float64)
+            return arr[:, 4].copy(), arr[:, 0].astype(np.int64)
         except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {e}")
+            logger.error("Error fetching data for %s: %s", symbol, e)
             return None
     
-    def detect_crossover(self, symbol: str, df: pd.DataFrame) -> Dict:
-        """Detect EMA crossover signals"""
-        if df is None or len(df) < 25:
-            return None
+    def ohlcv_limit(self, symbol: str, limit: int) -> int:
+        """Candles to fetch: limit if the EMA state can be advanced from them, else a full seed"""
+        state = self.ema_state.get(symbol)
+        window_start = (self.exchange.milliseconds() // self.timeframe_ms - (limit - 1)) * self.timeframe_ms
+        if state is not None and state['last_ts'] + self.timeframe_ms >= window_start:
+            return limit
+        return 100
+    
+    async def update_close_buffers(self, top_coins: List[str], tickers: Dict) -> List[Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """Advance the rolling close buffers from one fetch_tickers snapshot"""
+        results: Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        backfill = []
         
-        # Calculate EMAs
-        df['ema_10'] = self.calculate_ema(df['close'], 10)
-        df['ema_20'] = self.calculate_ema(df['close'], 20)
+        for symbol in top_coins:
+            ticker = tickers.get(symbol) or {}
+            close = ticker.get('close')
+            ts = ticker.get('timestamp') or self.exchange.milliseconds()
+            bucket = ts // self.timeframe_ms
+            buffer = self.close_buffers[symbol]
+            last_bucket = buffer[-1][0] // self.timeframe_ms if buffer else None
+            
+            # Unknown symbol, missing price or skipped candles: reload from OHLCV
+            if close is None or last_bucket is None or bucket > last_bucket + 1:
+                backfill.append(symbol)
+                continue
+            
+            if bucket > last_bucket:
+                # Sampled just past the boundary, the latest price is the best estimate of the
+                # closed candle's close; the new entry only holds the forming candle's place
+                buffer[-1] = (buffer[-1][0], float(close))
+                buffer.append((bucket * self.timeframe_ms, float(close)))
+            elif bucket == last_bucket:
+                buffer[-1] = (buffer[-1][0], float(close))
+            
+            timestamps, closes = zip(*buffer)
+            results[symbol] = (np.array(closes), np.array(timestamps, dtype=np.int64))
         
-        # Get last two rows
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
+        if backfill:
+            tasks = [self.fetch_ohlcv_data(symbol, self.timeframe, self.ohlcv_limit(symbol, 40)) for symbol in backfill]
+            for symbol, data in zip(backfill, await asyncio.gather(*tasks)):
+                if data is not None:
+                    buffer = self.close_buffers[symbol]
+                    buffer.clear()
+                    buffer.extend(zip(data[1].tolist(), data[0].tolist()))
+                results[symbol] = data
         
-        signal = None
+        return [results[symbol] for symbol in top_coins]
+    
+    def update_ema_state(self, symbol: str, closes: np.ndarray, timestamps: np.ndarray) -> Optional[Tuple[float, float, float, float, float, int]]:
+        """Advance EMA state over newly closed candles and return (prev10, prev20, cur10, cur20, price, timestamp)"""
+        if closes is None:
+            return None
         
-        # Bullish crossover
-        if previous['ema_10'] <= previous['ema_20'] and current['ema_10'] > current['ema_20']:
-            signal = {
-                'type': 'BULLISH',
-                'symbol': symbol,
-                'price': current['close'],
-                'ema_10': current['ema_10'],
-                'ema_20': current['ema_20'],
-                'timestamp': current['timestamp']
-            }
+        k10 = 2 / (10 + 1)
+        k20 = 2 / (20 + 1)
         
-        # Bearish crossover
-        elif previous['ema_10'] >= previous['ema_20'] and current['ema_10'] < current['ema_20']:
-            signal = {
-                'type': 'BEARISH',
-                'symbol': symbol,
-                'price': current['close'],
-                'ema_10': current['ema_10'],
-                'ema_20': current['ema_20'],
-                'timestamp': current['timestamp']
+        # Only closed candles count; the forming one may or may not be published yet
+        current_open = self.exchange.milliseconds() // self.timeframe_ms * self.timeframe_ms
+        closed = int(np.searchsorted(timestamps, current_open))
+        closes = closes[:closed]
+        timestamps = timestamps[:closed]
+        if not closed:
+            return None
+        
+        # A fresh state only needs the newly closed candles; seeding needs 25
+        state = self.ema_state.get(symbol)
+        if state is None or state['last_ts'] + self.timeframe_ms < timestamps[0]:
+            # Seed from history once (or again if we fell behind the fetched window)
+            if closed < 25:
+                return None
+            ema10, ema20 = dual_ema_numba(np.asarray(closes, dtype=np.float64), k10, k20)
+            self.ema_state[symbol] = {
+                'ema10': float(ema10[-1]),
+                'ema20': float(ema20[-1]),
+                'last_ts': int(timestamps[-1])
             }
+            return float(ema10[-2]), float(ema20[-2]), float(ema10[-1]), float(ema20[-1]), float(closes[-1]), int(timestamps[-1])
         
-        return signal
+        # Advance through the candles that closed since the last check; matching
+        # by timestamp keeps this right when the exchange omits no-trade candles
+        start = int(np.searchsorted(timestamps, state['last_ts'], side='right'))
+        if start >= closed:
+            return None
+        
+        for close in closes[start:].tolist():
+            prev10 = state['ema10']
+            prev20 = state['ema20']
+            state['ema10'] = k10 * close + (1 - k10) * prev10
+            state['ema20'] = k20 * close + (1 - k20) * prev20
+        state['last_ts'] = int(timestamps[-1])
+        
+        # Compare the last two closed candles
+        return prev10, prev20, state['ema10'], state['ema20'], float(closes[-1]), int(timestamps[-1])
+    
+    def detect_crossover(self, symbol: str, prev10: float, prev20: float, cur10: float, cur20: float,
+                         price: float, cur_ts_ms: int) -> Optional[Dict]:
+        """Detect EMA crossover signals"""
+        # A crossover is a sign flip of EMA(10) - EMA(20); touching zero then crossing counts
+        d_prev = prev10 - prev20
+        d_cur = cur10 - cur20
+        if d_cur == 0 or d_prev * d_cur > 0:
+            return None
+        
+        return {
+            'type': 'BULLISH' if d_cur > 0 else 'BEARISH',
+            'symbol': symbol,
+            'price': price,
+            'ema_10': cur10,
+            'ema_20': cur20,
+            'timestamp': cur_ts_ms,
+            'timestamp_str': datetime.fromtimestamp(cur_ts_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        }
     
     def format_signal_message(self, signal: Dict) -> str:
         """Format signal as Telegram message"""
         emoji = "🟢" if signal['type'] == 'BULLISH' else "🔴"
-        
-        message = f"""
-{emoji} <b>{signal['type']} CROSSOVER DETECTED</b> {emoji}
-
-📊 <b>Symbol:</b> {signal['symbol']}
-💰 <b>Price:</b> ${signal['price']:.2f}
-📈 <b>EMA(10):</b> {signal['ema_10']:.2f}
-📉 <b>EMA(20):</b> {signal['ema_20']:.2f}
-⏰ <b>Time:</b> {signal['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}
-⏱️ <b>Timeframe:</b> {self.timeframe}
-🏦 <b>Exchange:</b> Coinbase
-"""
-        return message.strip()
+        return _SIGNAL_TEMPLATE(emoji=emoji, timeframe=self.timeframe, exchange=EXCHANGE_NAME, **signal)
     
-    def check_signals(self):
+    async def check_signals(self):
         """Main function to check for signals"""
-        logger.info(f"Checking signals for timeframe: {self.timeframe}")
+        logger.info("Checking signals for timeframe: %s", self.timeframe)
+        
+        results = None
+        
+        # For 1h+ timeframes a single fetch_tickers call feeds both the ranking and the closes
+        if self.timeframe_ms >= 3600 * 1000:
+            try:
+                tickers = await self.exchange.fetch_tickers()
+                top_coins = await self.get_top_coins_by_volume(5, tickers)
+                results = await self.update_close_buffers(top_coins, tickers)
+            except Exception as e:
+                logger.error("Error updating closes from tickers: %s", e)
         
-        # Get top coins
-        top_coins = self.get_top_coins_by_volume(5)
+        if results is None:
+            # Get top coins
+            top_coins = await self.get_top_coins_by_volume(5)
+            
+            # Fetch all symbols concurrently (ccxt's rate limiter spaces the requests);
+            # symbols without usable EMA state get the longer seed history
+            tasks = [self.fetch_ohlcv_data(symbol, self.timeframe, self.ohlcv_limit(symbol, 25)) for symbol in top_coins]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         signals_found = []
         
-        for symbol in top_coins:
+        for symbol, data in zip(top_coins, results):
             try:
-                # Fetch data
-                df = self.fetch_ohlcv_data(symbol, self.timeframe, limit=100)
+                if isinstance(data, Exception):
+                    raise data
+                
+                if data is None:
+                    continue
+                
+                closes, timestamps = data
+                emas = self.update_ema_state(symbol, closes, timestamps)
                 
-                if df is not None:
+                if emas is not None:
                     # Detect crossover
-                    signal = self.detect_crossover(symbol, df)
+                    signal = self.detect_crossover(symbol, *emas)
                     
                     if signal:
                         # Check if new signal
@@ -201,50 +370,64 @@ class CryptoSignalBot:
                            (current_time - self.last_signals[signal_key]) > 7200:
                             signals_found.append(signal)
                             self.last_signals[signal_key] = current_time
-                            logger.info(f"New signal detected: {signal}")
-                
-                # Rate limiting
-                time.sleep(1.5)
+                            logger.info("New signal detected: %s", signal)
                 
             except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
+                logger.error("Error processing %s: %s", symbol, e)
                 continue
         
-        # Send signals
+        # Send signals batched into as few messages as Telegram's length limit allows
         if signals_found:
+            separator = "\n\n---\n\n"
+            combined = ""
             for signal in signals_found:
                 message = self.format_signal_message(signal)
-                self.send_telegram_message(message)
+                if combined and len(combined) + len(separator) + len(message) > 4000:
+                    await asyncio.to_thread(self.send_telegram_message, combined)
+                    combined = ""
+                combined = f"{combined}{separator}{message}" if combined else message
+            await asyncio.to_thread(self.send_telegram_message, combined)
         else:
             logger.info("No new crossover signals detected")
     
-    def run(self):
+    def seconds_until_next_candle(self) -> float:
+        """Seconds until just after the current candle closes"""
+        now_ms = int(time.time() * 1000)
+        next_close = ((now_ms // self.timeframe_ms) + 1) * self.timeframe_ms
+        return max(5, (next_close - now_ms) / 1000 + 10)
+    
+    async def run(self):
         """Main loop"""
         logger.info("Starting Crypto Signal Bot...")
-        self.send_telegram_message(f"🚀 <b>Crypto Signal Bot Started!</b>\n\n🏦 <b>Exchange:</b> Coinbase\n⏱️ <b>Timeframe:</b> {self.timeframe}\n📊 <b>Monitoring:</b> Top 5 coins by volume\n📈 <b>Signal:</b> EMA(10) x EMA(20) crossovers")
+        await asyncio.to_thread(self.send_telegram_message, f"🚀 <b>Crypto Signal Bot Started!</b>\n\n🏦 <b>Exchange:</b> {EXCHANGE_NAME}\n⏱️ <b>Timeframe:</b> {self.timeframe}\n📊 <b>Monitoring:</b> Top 5 coins by volume\n📈 <b>Signal:</b> EMA(10) x EMA(20) crossovers")
         
-        while True:
-            try:
-                # Check signals
-                self.check_signals()
-                
-                # Wait 5 minutes
-                logger.info("Waiting 5 minutes before next check...")
-                time.sleep(300)
-                
-            except KeyboardInterrupt:
-                logger.info("Bot stopped by user")
-                self.send_telegram_message("⏹️ Bot stopped")
-                break
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                self.send_telegram_message(f"⚠️ Error occurred: {str(e)}")
-                time.sleep(60)
+        try:
+            while True:
+                try:
+                    # Check signals
+                    await self.check_signals()
+                    
+                    # Wait for the next candle close
+                    wait = self.seconds_until_next_candle()
+                    logger.info("Waiting %.0f seconds for the next %s candle close...", wait, self.timeframe)
+                    await asyncio.sleep(wait)
+                    
+                except asyncio.CancelledError:
+                    logger.info("Bot stopped")
+                    await asyncio.to_thread(self.send_telegram_message, "⏹️ Bot stopped")
+                    raise
+                except Exception as e:
+                    logger.error("Error in main loop: %s", e)
+                    await asyncio.to_thread(self.send_telegram_message, f"⚠️ Error occurred: {str(e)}")
+                    await asyncio.sleep(60)
+        finally:
+            await self.exchange.close()
+            self.http.close()
 
 def run_bot():
     """Run the bot in a separate thread"""
     bot = CryptoSignalBot()
-    bot.run()
+    asyncio.run(bot.run())
 
 if __name__ == "__main__":
     # Start bot in background thread
@@ -252,7 +435,7 @@ if __name__ == "__main__":
     bot_thread = Thread(target=run_bot, daemon=True)
     bot_thread.start()
     
-    # Start Flask web server
+    # Serve the Flask app with waitress
     port = int(os.getenv('PORT', 10000))
-    logger.info(f"Starting Flask server on port {port}...")
-    app.run(host='0.0.0.0', port=port)
+    logger.info("Starting waitress server on port %d...", port)
+    serve(app, host='0.0.0.0', port=port, threads=2)
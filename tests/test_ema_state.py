@@ -0,0 +1,128 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import bot
+
+TF_MS = 3600 * 1000
+CANDLES = 2000
+FIRST_POLL = 30
+
+
+class FakeExchange:
+    """Serves a fixed 1h candle history as of a settable clock"""
+
+    def __init__(self, closes: np.ndarray, publish_forming: bool = True):
+        self.closes = closes
+        self.publish_forming = publish_forming
+        self.now = 0
+
+    def milliseconds(self) -> int:
+        return self.now
+
+    @staticmethod
+    def parse_timeframe(timeframe: str) -> int:
+        return TF_MS // 1000
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        forming = self.now // TF_MS
+        last = forming if self.publish_forming else forming - 1
+        first = max(0, since // TF_MS)
+        rows = list(range(first, last + 1))[:limit]
+        return [[i * TF_MS, c, c, c, c, 1.0] for i, c in ((i, float(self.closes[i])) for i in rows)]
+
+    async def fetch_tickers(self):
+        # Polled just past the boundary, the last price is the just-closed candle's close
+        closed = self.now // TF_MS - 1
+        return {'X/USD': {'close': float(self.closes[closed]), 'timestamp': self.now}}
+
+
+def ewm_adjust_false(x: np.ndarray, period: int) -> np.ndarray:
+    """Full recomputation of pandas ewm(span=period, adjust=False).mean()"""
+    alpha = 2 / (period + 1)
+    out = np.empty_like(x)
+    s = x[0]
+    for i, v in enumerate(x):
+        s = alpha * v + (1 - alpha) * s
+        out[i] = s
+    return out
+
+
+def reference_crossovers(closes: np.ndarray) -> dict:
+    """Crossovers of EMA(10) and EMA(20) on each closed candle, recomputed from scratch"""
+    d = ewm_adjust_false(closes, 10) - ewm_adjust_false(closes, 20)
+    return {
+        i: 'BULLISH' if d[i] > 0 else 'BEARISH'
+        for i in range(FIRST_POLL, CANDLES)
+        if d[i] != 0 and d[i - 1] * d[i] <= 0
+    }
+
+
+def make_bot(exchange: FakeExchange) -> bot.CryptoSignalBot:
+    signal_bot = bot.CryptoSignalBot()
+    signal_bot.exchange = exchange
+    signal_bot.timeframe_ms = TF_MS
+    return signal_bot
+
+
+def random_walk(seed: int) -> np.ndarray:
+    # One extra candle so the last poll still has a forming candle
+    return 100 + np.cumsum(np.random.default_rng(seed).normal(0, 1, CANDLES + 1))
+
+
+def collect(signal_bot: bot.CryptoSignalBot, fetch) -> dict:
+    """Poll 10 s after each candle closes and record the reported crossovers"""
+    async def poll():
+        found = {}
+        for i in range(FIRST_POLL, CANDLES):
+            signal_bot.exchange.now = (i + 1) * TF_MS + 10_000
+            data = await fetch()
+            if data is None:
+                continue
+            emas = signal_bot.update_ema_state('X/USD', *data)
+            signal = signal_bot.detect_crossover('X/USD', *emas) if emas else None
+            if signal:
+                found[signal['timestamp'] // TF_MS] = signal['type']
+        return found
+
+    return asyncio.run(poll())
+
+
+def test_reference_matches_pandas_ewm():
+    pd = pytest.importorskip('pandas')
+    closes = random_walk(0)
+    expected = pd.Series(closes).ewm(span=20, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ewm_adjust_false(closes, 20), expected)
+
+
+@pytest.mark.parametrize('publish_forming', [True, False])
+@pytest.mark.parametrize('seed', [1, 2])
+def test_ohlcv_path_matches_full_recomputation(seed, publish_forming):
+    closes = random_walk(seed)
+    signal_bot = make_bot(FakeExchange(closes, publish_forming))
+
+    found = collect(
+        signal_bot,
+        lambda: signal_bot.fetch_ohlcv_data('X/USD', '1h', signal_bot.ohlcv_limit('X/USD', 25))
+    )
+
+    assert found == reference_crossovers(closes[:CANDLES])
+    state = signal_bot.ema_state['X/USD']
+    assert state['last_ts'] == (CANDLES - 1) * TF_MS
+    assert state['ema20'] == pytest.approx(ewm_adjust_false(closes[:CANDLES], 20)[-1])
+
+
+@pytest.mark.parametrize('seed', [3, 4])
+def test_tickers_path_matches_full_recomputation(seed):
+    closes = random_walk(seed)
+    signal_bot = make_bot(FakeExchange(closes))
+
+    async def fetch():
+        tickers = await signal_bot.exchange.fetch_tickers()
+        return (await signal_bot.update_close_buffers(['X/USD'], tickers))[0]
+
+    found = collect(signal_bot, fetch)
+
+    assert found == reference_crossovers(closes[:CANDLES])
+    assert signal_bot.ema_state['X/USD']['ema10'] == pytest.approx(ewm_adjust_false(closes[:CANDLES], 10)[-1])